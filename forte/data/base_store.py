@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from abc import abstractmethod
-from typing import List, Iterator, Tuple, Any, Optional
+from typing import List, Iterator, Tuple, Any, Optional, Sequence
 
 __all__ = ["BaseStore"]
 
@@ -21,6 +21,8 @@ __all__ = ["BaseStore"]
 class BaseStore:
     r"""The base class which will be used by :class:`~forte.data.data_store.DataStore`."""
 
+    __slots__ = ()
+
     def __init__(self):
         r"""
         This is a base class for the efficient underlying data structure. A
@@ -46,6 +48,23 @@ class BaseStore:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def add_annotations_raw(
+        self, type_name: str, begins: Sequence[int], ends: Sequence[int]
+    ) -> List[int]:
+        r"""This function adds a batch of annotation entries with ``begins``
+        and ``ends`` indices to the ``type_name`` sorted list in
+        ``self.__elements``, returns the ``tid`` for the inserted entries.
+
+        Args:
+            type_name: The index of Annotation sorted list in ``self.__elements``.
+            begins: Begin indices of the entries.
+            ends: End indices of the entries.
+        Returns:
+            A list of ``tid`` of the entries.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def add_link_raw(
         self, type_name: str, parent_tid: int, child_tid: int
@@ -11,10 +11,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Iterator, Tuple, Optional, Any
-import uuid
-from bisect import bisect_left
-from heapq import heappush, heappop
+from typing import Dict, List, Iterator, Tuple, Optional, Any, Sequence
+import operator
+import secrets
+import sys
+from functools import lru_cache
+from heapq import heapify, heappop, heapreplace
+from itertools import chain
 from sortedcontainers import SortedList
 
 from forte.utils import get_class
@@ -25,12 +28,219 @@ from forte.utils.utils import get_full_module_name
 
 __all__ = ["DataStore"]
 
+# Module-level copies of the entry field indices used in the hot paths below,
+# so that every access is a single global lookup instead of also looking up
+# the attribute on ``constants``.
+_BEGIN_INDEX = constants.BEGIN_INDEX
+_END_INDEX = constants.END_INDEX
+_TID_INDEX = constants.TID_INDEX
+
+# ``co_iterator_annotation_like`` sorts the entries of all types at once
+# instead of merging them when there are at least this many types ...
+_SORT_MERGE_MIN_TYPES = 16
+# ... and at most this many entries in total.
+_SORT_MERGE_MAX_ENTRIES = 100000
+
+
+def _annotation_sort_key(entry: List) -> int:
+    r"""The sort key of annotation-like entry lists. Entries are ordered by
+    (``begin``, ``end``), and both fields are packed into a single integer
+    ``begin << 64 | end``: sorted containers store and compare one ``int``
+    per entry instead of a tuple of two. The packing preserves the order for
+    every span of Python integers with ``0 <= end < 2 ** 64``, which
+    :func:`_check_span` enforces when entries are added.
+
+    Args:
+        entry: An annotation-like entry data.
+
+    Returns:
+        The packed (``begin``, ``end``) key of the entry.
+    """
+    return (entry[_BEGIN_INDEX] << 64) | entry[_END_INDEX]
+
+
+def _check_span(begin: int, end: int) -> Tuple[int, int]:
+    r"""Convert the ``begin`` and ``end`` of a new annotation-like entry to
+    Python integers and check that the span can be ordered by
+    :func:`_annotation_sort_key`. Integer types such as NumPy integers are
+    converted losslessly with :func:`operator.index`, since shifting them
+    would overflow instead of producing the packed key. Other types, e.g.,
+    floats, strings or booleans, are rejected rather than truncated or
+    parsed.
+
+    Args:
+        begin: Begin index of the entry.
+        end: End index of the entry.
+
+    Returns:
+        The ``begin`` and ``end`` of the entry as Python integers.
+
+    Raises:
+        TypeError: when ``begin`` or ``end`` is not an integer.
+        ValueError: when ``end`` is negative or not smaller than ``2 ** 64``.
+    """
+    if isinstance(begin, bool) or isinstance(end, bool):
+        raise TypeError(
+            f"The begin and end indices of an annotation must be integers,"
+            f" but got span ({begin!r}, {end!r})."
+        )
+    begin, end = operator.index(begin), operator.index(end)
+    if not 0 <= end < 1 << 64:
+        raise ValueError(
+            f"The end index of an annotation must be in the range"
+            f" [0, 2 ** 64), but got span ({begin}, {end})."
+        )
+    return begin, end
+
+
+@lru_cache(maxsize=None)
+def _get_class(type_name: str):
+    r"""A cached version of :func:`~forte.utils.get_class`. The same small set
+    of entry type names is resolved repeatedly, so every name only walks the
+    import machinery once. Failed lookups are not cached, since the module of
+    a type (e.g., a generated ontology) may become importable later.
+    """
+    return get_class(type_name)
+
+
+@lru_cache(maxsize=None)
+def _get_entry_attributes(type_name: str) -> Tuple[str, ...]:
+    r"""A cached lookup of the dataclass attributes of an entry class. See
+    :meth:`DataStore._get_entry_attributes_by_class`.
+
+    Args:
+        type_name: A fully qualified name of an entry class.
+
+    Returns:
+        A tuple of attribute names of the class.
+    """
+    class_ = _get_class(type_name)
+    try:
+        return tuple(class_.__dataclass_fields__.keys())
+    except AttributeError:
+        return ()
+
+
+def _merge_two(first: SortedList, second: SortedList) -> Iterator[List]:
+    r"""Merge two sorted annotation-like entry lists by ``begin`` and ``end``.
+    This is the two-list special case of :func:`heapq.merge`: every yielded
+    entry costs a single comparison and no heap operation. When two entries
+    share the same span, the one from ``first`` is yielded first.
+
+    Args:
+        first: The entry list whose entries go first on ties.
+        second: The other entry list.
+
+    Returns:
+        An iterator of entries of both lists in sorted order.
+    """
+    # Bind the indices to local names and keep the spans of both current
+    # entries in local variables, so that the loop does not look up globals
+    # or subscript entries again for every comparison.
+    begin_index, end_index = _BEGIN_INDEX, _END_INDEX
+    first_iter, second_iter = iter(first), iter(second)
+    first_entry = next(first_iter, None)
+    second_entry = next(second_iter, None)
+    if first_entry is not None and second_entry is not None:
+        first_begin = first_entry[begin_index]
+        first_end = first_entry[end_index]
+        second_begin = second_entry[begin_index]
+        second_end = second_entry[end_index]
+        while True:
+            if second_begin < first_begin or (
+                second_begin == first_begin and second_end < first_end
+            ):
+                yield second_entry
+                second_entry = next(second_iter, None)
+                if second_entry is None:
+                    break
+                second_begin = second_entry[begin_index]
+                second_end = second_entry[end_index]
+            else:
+                yield first_entry
+                first_entry = next(first_iter, None)
+                if first_entry is None:
+                    break
+                first_begin = first_entry[begin_index]
+                first_end = first_entry[end_index]
+    # drain the list that is not exhausted yet
+    if first_entry is not None:
+        yield first_entry
+        yield from first_iter
+    if second_entry is not None:
+        yield second_entry
+        yield from second_iter
+
+
+def _merge_runs(entry_lists: List[SortedList]) -> Iterator[List]:
+    r"""Merge several sorted annotation-like entry lists by ``begin`` and
+    ``end``. Unlike :func:`heapq.merge`, which updates the heap for every
+    yielded entry, the heap is only updated when the current list stops
+    being the smallest one: entries of that list are yielded directly as long
+    as they sort before the head of the runner-up list. Annotation types such
+    as tokens usually form long runs between the entries of sparser types,
+    so most entries skip the heap entirely. When entries share the same span,
+    the one from the list that comes first in ``entry_lists`` is yielded
+    first.
+
+    Args:
+        entry_lists: The entry lists to merge.
+
+    Returns:
+        An iterator of entries of all lists in sorted order.
+    """
+    # Every heap item is ``[key, list index, head entry, iterator]``. The
+    # list index is unique, so comparisons never reach the entries, and it
+    # breaks ties between equal keys in the order of ``entry_lists``.
+    heap = []
+    for idx, entry_list in enumerate(entry_lists):
+        entry_iter = iter(entry_list)
+        entry = next(entry_iter, None)
+        if entry is not None:
+            heap.append([_annotation_sort_key(entry), idx, entry, entry_iter])
+    heapify(heap)
+    while len(heap) > 1:
+        top = heap[0]
+        _, idx, entry, entry_iter = top
+        # The runner-up is the smaller one of the two children of the root.
+        runner_up = heap[1] if len(heap) == 2 or heap[1] < heap[2] else heap[2]
+        limit_key, limit_idx = runner_up[0], runner_up[1]
+        yield entry
+        for entry in entry_iter:
+            key = _annotation_sort_key(entry)
+            if key < limit_key or (key == limit_key and idx < limit_idx):
+                yield entry
+            else:
+                top[0] = key
+                top[2] = entry
+                heapreplace(heap, top)
+                break
+        else:
+            heappop(heap)
+    if heap:
+        yield heap[0][2]
+        yield from heap[0][3]
+
 
 class DataStore(BaseStore):
     # TODO: temporarily disable this for development purposes.
     # pylint: disable=pointless-string-statement
     _type_attributes: dict = {}
 
+    # Attributes of a DataStore are read on every entry access, so they are
+    # stored in fixed slots instead of a per-instance ``__dict__``.
+    __slots__ = (
+        "_onto_file_path",
+        "_dynamically_add_type",
+        "__elements",
+        "__entry_dict",
+        "_tid_counter",
+        "_is_annotation_cache",
+        "_attr_index_flat",
+        "_entry_defaults",
+        "_subtype_cache",
+    )
+
     def __init__(
         self, onto_file_path: Optional[str] = None, dynamically_add_type=True
     ):
@@ -96,8 +306,10 @@ class DataStore(BaseStore):
 
         Here, ``type_name`` is the fully qualifie name of this type represented
         by ``entry list``. It must be a valid ontology defined as a class.
+        The ``type_name`` string is interned, so all entries of a type share
+        a single string object.
         ``tid`` is a unique id of every entry, which is internally generated by
-        uuid.uuid4().
+        a counter of the data store (see ``_new_tid``).
         Each ``type_name`` corresponds to a pre-defined ordered list of
         attributes, the exact order is determined by the system through the
         ontology specifications.
@@ -198,9 +410,46 @@ class DataStore(BaseStore):
         """
         self.__entry_dict: dict = {}
 
+        """
+        The counter used to generate ``tid``. The upper 32 bits are randomly
+        seeded so that entries from different DataStore objects are unlikely
+        to share a ``tid``, while all ``tid`` values stay within 64 bits.
+        """
+        self._tid_counter: int = secrets.randbits(32) << 32
+
+        """
+        A cache of the results of ``_is_annotation``, keyed by ``type_name``.
+        """
+        self._is_annotation_cache: Dict[str, bool] = {}
+
+        """
+        A flat cache of attribute indices keyed by (``type_name``,
+        ``attr_name``), so that a lookup costs one hash instead of walking
+        ``DataStore._type_attributes``.
+        """
+        self._attr_index_flat: Dict[Tuple[str, str], int] = {}
+
+        """
+        A cache of the interned type name and the default attribute values
+        (all ``None``) that fill a new entry, keyed by ``type_name``.
+        """
+        self._entry_defaults: Dict[str, Tuple[str, List[None]]] = {}
+
+        """
+        A cache of the types in ``__elements`` that are subclasses of a type
+        (including the type itself), keyed by the fully qualified name of
+        the queried type. It is used by ``get`` and is cleared by
+        ``_clear_subtype_cache`` whenever a type is added or removed.
+        """
+        self._subtype_cache: Dict[str, List[str]] = {}
+
     def _new_tid(self) -> int:
-        r"""This function generates a new ``tid`` for an entry."""
-        return uuid.uuid4().int
+        r"""This function generates a new ``tid`` for an entry. ``tid`` is
+        a 64-bit integer taken from a monotonically increasing counter, which
+        is much cheaper to generate and hash than a 128-bit ``uuid4``.
+        """
+        self._tid_counter += 1
+        return self._tid_counter
 
     def _get_type_info(self, type_name: str) -> Dict[str, Any]:
         """
@@ -235,8 +484,9 @@ class DataStore(BaseStore):
             dynamic import is disabled.
         """
         # check if type is in dictionary
-        if type_name in DataStore._type_attributes:
-            return DataStore._type_attributes[type_name]
+        type_info = DataStore._type_attributes.get(type_name)
+        if type_info is not None:
+            return type_info
         if not self._dynamically_add_type:
             raise ValueError(
                 f"{type_name} is not an existing type in current data store."
@@ -245,12 +495,12 @@ class DataStore(BaseStore):
                 f"types specified in the ontology file."
             )
         # get attribute dictionary
-        attributes = DataStore._get_entry_attributes_by_class(type_name)
+        attributes = _get_entry_attributes(type_name)
 
         attr_dict = {}
         attr_idx = constants.ENTRY_TYPE_INDEX + 1
         for attr_name in attributes:
-            attr_dict[attr_name] = attr_idx
+            attr_dict[sys.intern(attr_name)] = attr_idx
             attr_idx += 1
 
         new_entry_info = {
@@ -291,6 +541,24 @@ class DataStore(BaseStore):
         """
         return self._get_type_info(type_name)["parent_class"]
 
+    def _get_attr_index(self, type_name: str, attr_name: str) -> int:
+        """Get the index of attribute ``attr_name`` in the entry data of type
+        ``type_name``, and cache it in ``self._attr_index_flat``.
+
+        Args:
+            type_name (str): The fully qualified type name of a type.
+            attr_name (str): The name of the attribute.
+        Returns:
+            attr_id (int): The index of the attribute in the entry data.
+        Raises:
+            KeyError: when ``type_name`` has no attribute ``attr_name``.
+        """
+        attr_id = self._get_type_attribute_dict(type_name).get(attr_name)
+        if attr_id is None:
+            raise KeyError(f"{type_name} has no {attr_name} attribute.")
+        self._attr_index_flat[(type_name, attr_name)] = attr_id
+        return attr_id
+
     def _num_attributes_for_type(self, type_name: str) -> int:
         """Get the length of the attribute dict of an entry type.
         Args:
@@ -300,6 +568,27 @@ class DataStore(BaseStore):
         """
         return len(self._get_type_attribute_dict(type_name))
 
+    def _get_entry_defaults(self, type_name: str) -> Tuple[str, List[None]]:
+        """Get the interned type name and the default attribute values of a
+        new entry of a type, i.e., a list with a ``None`` for each attribute.
+        Both are built once per type and cached, so that entries of the same
+        type share one type name string. The list must not be modified by
+        the caller.
+        Args:
+            type_name (str): The fully qualified type name of the new entry.
+        Returns:
+            A tuple of the interned ``type_name`` and a list of ``None``
+            values, one per attribute.
+        """
+        defaults = self._entry_defaults.get(type_name)
+        if defaults is None:
+            defaults = (
+                sys.intern(type_name),
+                self._num_attributes_for_type(type_name) * [None],
+            )
+            self._entry_defaults[type_name] = defaults
+        return defaults
+
     def _new_annotation(self, type_name: str, begin: int, end: int) -> List:
         r"""This function generates a new annotation with default fields.
         All default fields are filled with None.
@@ -318,8 +607,9 @@ class DataStore(BaseStore):
         tid: int = self._new_tid()
         entry: List[Any]
 
+        type_name, default_attrs = self._get_entry_defaults(type_name)
         entry = [begin, end, tid, type_name]
-        entry += self._num_attributes_for_type(type_name) * [None]
+        entry += default_attrs
 
         return entry
 
@@ -343,8 +633,9 @@ class DataStore(BaseStore):
         tid: int = self._new_tid()
         entry: List[Any]
 
+        type_name, default_attrs = self._get_entry_defaults(type_name)
         entry = [parent_tid, child_tid, tid, type_name]
-        entry += self._num_attributes_for_type(type_name) * [None]
+        entry += default_attrs
 
         return entry
 
@@ -364,11 +655,21 @@ class DataStore(BaseStore):
 
         tid: int = self._new_tid()
 
+        type_name, default_attrs = self._get_entry_defaults(type_name)
         entry = [member_type, [], tid, type_name]
-        entry += self._num_attributes_for_type(type_name) * [None]
+        entry += default_attrs
 
         return entry
 
+    def _clear_subtype_cache(self):
+        r"""This function is called when an entry list is added to or removed
+        from ``self.__elements``. It drops all cached subtype lists in
+        ``self._subtype_cache``, which ``get`` rebuilds on demand. Adding or
+        removing a type thus never resolves any class, and it cannot fail
+        on types whose classes are not importable.
+        """
+        self._subtype_cache.clear()
+
     def _is_subclass(
         self, type_name: str, cls, no_dynamic_subclass: bool = False
     ) -> bool:
@@ -404,7 +705,7 @@ class DataStore(BaseStore):
             if cls_qualified_name in type_name_parent_class:
                 return True
             else:
-                entry_class = get_class(type_name)
+                entry_class = _get_class(type_name)
                 if issubclass(entry_class, cls):
                     type_name_parent_class.add(cls_qualified_name)
                     return True
@@ -422,8 +723,13 @@ class DataStore(BaseStore):
             type or not.
         """
         # TODO: use is_subclass() in DataStore to replace this
-        entry_class = get_class(type_name)
-        return issubclass(entry_class, (Annotation, AudioAnnotation))
+        is_annotation = self._is_annotation_cache.get(type_name)
+        if is_annotation is None:
+            is_annotation = issubclass(
+                _get_class(type_name), (Annotation, AudioAnnotation)
+            )
+            self._is_annotation_cache[type_name] = is_annotation
+        return is_annotation
 
     def add_annotation_raw(self, type_name: str, begin: int, end: int) -> int:
         r"""This function adds an annotation entry with ``begin`` and ``end``
@@ -432,12 +738,20 @@ class DataStore(BaseStore):
 
         Args:
             type_name: The fully qualified type name of the new Annotation.
-            begin: Begin index of the entry.
-            end: End index of the entry.
+            begin: Begin index of the entry, an integer such as a Python
+                ``int`` or a NumPy integer. Floats, strings and booleans are
+                rejected.
+            end: End index of the entry, an integer of the same kind in the
+                range ``[0, 2 ** 64)``.
 
         Returns:
             ``tid`` of the entry.
+
+        Raises:
+            TypeError: when ``begin`` or ``end`` is not an integer.
+            ValueError: when ``end`` is out of range.
         """
+        begin, end = _check_span(begin, end)
         # We should create the `entry data` with the format
         # [begin, end, tid, type_id, None, ...].
         # A helper function _new_annotation() can be used to generate a
@@ -445,15 +759,68 @@ class DataStore(BaseStore):
         # A reference to the entry should be store in both self.__elements and
         # self.__entry_dict.
         entry = self._new_annotation(type_name, begin, end)
-        try:
-            self.__elements[type_name].add(entry)
-        except KeyError:
-            self.__elements[type_name] = SortedList(key=lambda s: (s[0], s[1]))
-            self.__elements[type_name].add(entry)
-        tid = entry[constants.TID_INDEX]
+        entry_list = self.__elements.get(type_name)
+        if entry_list is None:
+            entry_list = SortedList(key=_annotation_sort_key)
+            self.__elements[type_name] = entry_list
+            self._clear_subtype_cache()
+        entry_list.add(entry)
+        tid = entry[_TID_INDEX]
         self.__entry_dict[tid] = entry
         return tid
 
+    def add_annotations_raw(
+        self, type_name: str, begins: Sequence[int], ends: Sequence[int]
+    ) -> List[int]:
+        r"""This function adds a batch of annotation entries of the same
+        ``type_name`` to current data store object, where the i-th entry has
+        the ``begin`` index ``begins[i]`` and the ``end`` index ``ends[i]``.
+        It is equivalent to calling ``add_annotation_raw`` on every span, but
+        the new entries are sorted into the entry list at once instead of one
+        by one. Returns the ``tid`` for the inserted entries.
+
+        Args:
+            type_name: The fully qualified type name of the new Annotations.
+            begins: Begin indices of the entries, e.g., a list or a NumPy
+                array of integers. Floats, strings and booleans are rejected.
+            ends: End indices of the entries, in the same order as
+                ``begins``. Every end index must be an integer in the range
+                ``[0, 2 ** 64)``.
+
+        Returns:
+            A list of ``tid`` of the entries, in the same order as ``begins``.
+
+        Raises:
+            TypeError: when a begin or end index is not an integer.
+            ValueError: when ``begins`` and ``ends`` differ in length, or when
+                an end index is out of range.
+        """
+        if len(begins) != len(ends):
+            raise ValueError(
+                f"The number of begin indices ({len(begins)}) does not match"
+                f" the number of end indices ({len(ends)})."
+            )
+        # Spans given as NumPy arrays are converted to Python integers, so
+        # that entries created in batch are identical to the ones created
+        # by add_annotation_raw().
+        entries = [
+            self._new_annotation(type_name, *_check_span(begin, end))
+            for begin, end in zip(begins, ends)
+        ]
+        if not entries:
+            return []
+        entry_list = self.__elements.get(type_name)
+        if entry_list is None:
+            self.__elements[type_name] = SortedList(
+                entries, key=_annotation_sort_key
+            )
+            self._clear_subtype_cache()
+        else:
+            entry_list.update(entries)
+        tids = [entry[_TID_INDEX] for entry in entries]
+        self.__entry_dict.update(zip(tids, entries))
+        return tids
+
     def add_link_raw(
         self, type_name: str, parent_tid: int, child_tid: int
     ) -> Tuple[int, int]:
@@ -505,16 +872,14 @@ class DataStore(BaseStore):
         Raises:
             KeyError: when ``tid`` or ``attr_name`` is not found.
         """
-        try:
-            entry = self.__entry_dict[tid]
-            entry_type = entry[constants.ENTRY_TYPE_INDEX]
-        except KeyError as e:
-            raise KeyError(f"Entry with tid {tid} not found.") from e
+        entry = self.__entry_dict.get(tid)
+        if entry is None:
+            raise KeyError(f"Entry with tid {tid} not found.")
+        entry_type = entry[constants.ENTRY_TYPE_INDEX]
 
-        try:
-            attr_id = self._get_type_attribute_dict(entry_type)[attr_name]
-        except KeyError as e:
-            raise KeyError(f"{entry_type} has no {attr_name} attribute.") from e
+        attr_id = self._attr_index_flat.get((entry_type, attr_name))
+        if attr_id is None:
+            attr_id = self._get_attr_index(entry_type, attr_name)
 
         entry[attr_id] = attr_value
 
@@ -547,16 +912,14 @@ class DataStore(BaseStore):
         Raises:
             KeyError: when ``tid`` or ``attr_name`` is not found.
         """
-        try:
-            entry = self.__entry_dict[tid]
-            entry_type = entry[constants.ENTRY_TYPE_INDEX]
-        except KeyError as e:
-            raise KeyError(f"Entry with tid {tid} not found.") from e
+        entry = self.__entry_dict.get(tid)
+        if entry is None:
+            raise KeyError(f"Entry with tid {tid} not found.")
+        entry_type = entry[constants.ENTRY_TYPE_INDEX]
 
-        try:
-            attr_id = self._get_type_attribute_dict(entry_type)[attr_name]
-        except KeyError as e:
-            raise KeyError(f"{entry_type} has no {attr_name} attribute.") from e
+        attr_id = self._attr_index_flat.get((entry_type, attr_name))
+        if attr_id is None:
+            attr_id = self._get_attr_index(entry_type, attr_name)
 
         return entry[attr_id]
 
@@ -585,32 +948,30 @@ class DataStore(BaseStore):
             KeyError: when entry with ``tid`` is not found.
             RuntimeError: when internal storage is inconsistent.
         """
-        try:
-            # get `entry data` and remove it from entry_dict
-            entry_data = self.__entry_dict.pop(tid)
-        except KeyError as e:
+        # get `entry data` and remove it from entry_dict
+        entry_data = self.__entry_dict.pop(tid, None)
+        if entry_data is None:
             raise KeyError(
                 f"The specified tid [{tid}] "
                 f"does not correspond to an existing entry data "
-            ) from e
+            )
 
         _, _, tid, type_name = entry_data[:4]
-        try:
-            target_list = self.__elements[type_name]
-        except KeyError as e:
+        target_list = self.__elements.get(type_name)
+        if target_list is None:
             raise RuntimeError(
                 f"When deleting entry [{tid}], its type [{type_name}]"
                 f"does not exist in current entry lists."
-            ) from e
+            )
         # complexity: O(lgn)
         # if it's annotation type, use bisect to find the index
         if self._is_annotation(type_name):
-            entry_index = bisect_left(target_list, entry_data)
+            entry_index = self._get_annotation_index(target_list, entry_data)
         else:  # if it's group or link, use the index in entry_list
             entry_index = entry_data[constants.ENTRY_INDEX_INDEX]
 
         if (
-            entry_index >= len(target_list)
+            not 0 <= entry_index < len(target_list)
             or target_list[entry_index] != entry_data
         ):
             raise RuntimeError(
@@ -632,13 +993,12 @@ class DataStore(BaseStore):
             KeyError: when ``type_name`` is not found.
             IndexError: when ``index_id`` is not found.
         """
-        try:
-            target_list = self.__elements[type_name]
-        except KeyError as e:
+        target_list = self.__elements.get(type_name)
+        if target_list is None:
             raise KeyError(
                 f"The specified type [{type_name}] "
                 f"does not exist in current entry lists."
-            ) from e
+            )
         if index_id < 0 or index_id >= len(target_list):
             raise IndexError(
                 f"The specified index_id [{index_id}] of type [{type_name}]"
@@ -647,6 +1007,7 @@ class DataStore(BaseStore):
         target_list.pop(index_id)
         if not target_list:
             self.__elements.pop(type_name)
+            self._clear_subtype_cache()
 
     def get_entry(self, tid: int) -> Tuple[List, str]:
         r"""This function finds the entry with ``tid``. It returns the entry
@@ -662,9 +1023,9 @@ class DataStore(BaseStore):
             ValueError: An error occurred when input ``tid`` is not found.
             KeyError: An error occurred when ``entry_type`` is not found.
         """
-        if tid not in self.__entry_dict:
+        entry = self.__entry_dict.get(tid)
+        if entry is None:
             raise ValueError(f"Entry with tid {tid} not found.")
-        entry = self.__entry_dict[tid]
         entry_type = entry[constants.ENTRY_TYPE_INDEX]
         if entry_type not in self.__elements:
             raise KeyError(f"Entry of type {entry_type} is not found.")
@@ -685,22 +1046,64 @@ class DataStore(BaseStore):
             ValueError: An error occurred when no corresponding entry is found.
         """
         entry, entry_type = self.get_entry(tid=tid)
+        return self._get_entry_index(entry, entry_type)
+
+    def _get_entry_index(self, entry: List, entry_type: str) -> int:
+        r"""Return the ``index_id`` of an entry whose entry data and type have
+        already been looked up, e.g., by ``get_entry()``. Called by
+        ``get_entry_index()``, ``next_entry()`` and ``prev_entry()``.
+
+        Args:
+            entry: The entry data.
+            entry_type: The ``type_name`` of the entry.
+
+        Returns:
+            Index of the entry in the ``entry_type`` list.
+
+        Raises:
+            ValueError: An error occurred when the entry is not found in the
+                ``entry_type`` list.
+        """
         # If the entry is an annotation, bisect the annotation sortedlist
-        # to find the entry. May use LRU cache to optimize speed.
+        # to find the entry.
         # Otherwise, use ``index_id`` to find the index of the entry.
         index_id = -1
         if self._is_annotation(entry_type):
-            entry_list = self.__elements[entry_type]
-            index_id = entry_list.bisect_left(entry)
-            if (not 0 <= index_id < len(entry_list)) or (
-                entry_list[index_id][constants.TID_INDEX]
-                != entry[constants.TID_INDEX]
-            ):
+            index_id = self._get_annotation_index(
+                self.__elements[entry_type], entry
+            )
+            if index_id < 0:
                 raise ValueError(f"Entry {entry} not found in entry list.")
         else:
             index_id = entry[constants.ENTRY_INDEX_INDEX]
         return index_id
 
+    def _get_annotation_index(self, entry_list: SortedList, entry: List) -> int:
+        r"""Find the index of an annotation-like ``entry`` in its sorted
+        ``entry_list``. The list is bisected with its own key, so the
+        comparisons run inside ``SortedList`` instead of indexing the list
+        from Python. Entries sharing the same span are adjacent in the list,
+        and they are told apart by their ``tid``.
+
+        Args:
+            entry_list: The sorted entry list of the entry's type.
+            entry: The entry data to look for.
+
+        Returns:
+            Index of ``entry`` in ``entry_list``, or -1 if it is not found.
+        """
+        index_id = entry_list.bisect_left(entry)
+        tid = entry[_TID_INDEX]
+        begin = entry[_BEGIN_INDEX]
+        end = entry[_END_INDEX]
+        for candidate in entry_list.islice(index_id):
+            if candidate[_TID_INDEX] == tid:
+                return index_id
+            if candidate[_BEGIN_INDEX] != begin or candidate[_END_INDEX] != end:
+                break
+            index_id += 1
+        return -1
+
     def co_iterator_annotation_like(
         self, type_names: List[str]
     ) -> Iterator[List]:
@@ -711,7 +1114,7 @@ class DataStore(BaseStore):
         ``end`` fields. The ``co_iterator_annotation_like`` function will iterate those sorted lists
         together, and yield each entry in sorted order. This tasks is quite
         similar to merging several sorted list to one sorted list. We internally
-        use a `MinHeap` to order the order of yielded items, and the ordering
+        use a min heap to order the yielded items, and the ordering
         is determined by:
 
             - start index of the entry.
@@ -736,101 +1139,58 @@ class DataStore(BaseStore):
 
         """
 
-        n = len(type_names)
         # suppose the length of type_names is N and the length of entry list of
         # one type is M
         # then the time complexity of using min-heap to iterate
         # is O(M*log(N))
 
-        # Initialize the first entry of all entry lists
+        # Collect the entry lists to iterate
         # it avoids empty entry lists or non-existant entry list
-        first_entries = []
+        entry_lists = []
 
         for tn in type_names:
-            try:
-                first_entries.append(self.__elements[tn][0])
-            except KeyError as e:  # self.__elements[tn] will be catched here.
+            entry_list = self.__elements.get(tn)
+            if entry_list is None:
                 raise ValueError(
                     f"Input argument `type_names` to the function contains"
                     f" a type name [{tn}], which is not recognized."
                     f" Please input available ones in this DataStore"
                     f" object: {list(self.__elements.keys())}"
-                ) from e
-            except IndexError as e:  # self.__elements[tn][0] will be catched here.
+                )
+            if not entry_list:
                 raise ValueError(
                     f"Entry list of type name, {tn} which is "
                     " one list item of input argument `type_names`,"
                     " is empty. Please check data in this DataStore). "
                     " to see if empty lists are expected"
                     f" or remove {tn} from input parameter type_names"
-                ) from e
-
-        # record the current entry index for elements
-        # pointers[i] is the index of entry at (i)th sorted entry lists
-        pointers = [0] * n
-
-        # compare tuple (begin, end, order of type name in input argument
-        # type_names)
-        # we initialize a MinHeap with the first entry of all sorted entry lists
-        # in self.__elements
-        # the metric of comparing entry order is represented by the tuple
-        # (begin index of entry, end index of entry,
-        # the index of the entry type name in input parameter ``type_names``)
-        h: List[Tuple[Tuple[int, int, int], str]] = []
-        for p_idx in range(n):
-            entry_tuple = (
-                (
-                    first_entries[p_idx][constants.BEGIN_INDEX],
-                    first_entries[p_idx][constants.END_INDEX],
-                    p_idx,
-                ),
-                first_entries[p_idx][constants.ENTRY_TYPE_INDEX],
-            )
-            heappush(
-                h,
-                entry_tuple,
-            )
-
-        while h:
-            # NOTE: we push the ordering tuple to the heap
-            # but not the actual entry. But we can retrieve
-            # the entry by the tuple's data. Therefore,
-            # in some sense, the ordering tuple represents the entry.
-
-            # In the following comments,
-            # `the current entry` means the entry that
-            #      popped entry_tuple represents.
-            # `the current entry list` means the entry
-            # list (values of self.__elements) where `the current entry`
-            # locates at.
-
-            # retrieve the popped entry tuple (minimum item in the heap)
-            # and get the p_idx (the index of the current entry list in self.__elements)
-            entry_tuple = heappop(h)
-            (_, _, p_idx), type_name = entry_tuple
-            # get the index of current entry
-            # and locate the entry represented by the tuple for yielding
-            pointer = pointers[p_idx]
-            entry = self.__elements[type_name][pointer]
-            # check whether there is next entry in the current entry list
-            # if there is, then we push the new entry's tuple into the heap
-            if pointer + 1 < len(self.__elements[type_name]):
-                pointers[p_idx] += 1
-                new_pointer = pointers[p_idx]
-                new_entry = self.__elements[type_name][new_pointer]
-                new_entry_tuple = (
-                    (
-                        new_entry[constants.BEGIN_INDEX],
-                        new_entry[constants.END_INDEX],
-                        p_idx,
-                    ),
-                    new_entry[constants.ENTRY_TYPE_INDEX],
-                )
-                heappush(
-                    h,
-                    new_entry_tuple,
                 )
-            yield entry
+            entry_lists.append(entry_list)
+
+        # A single type needs no merging, and two types are merged without
+        # a heap.
+        if len(entry_lists) == 1:
+            yield from entry_lists[0]
+        elif len(entry_lists) == 2:
+            yield from _merge_two(entry_lists[0], entry_lists[1])
+        elif (
+            len(entry_lists) >= _SORT_MERGE_MIN_TYPES
+            and sum(map(len, entry_lists)) <= _SORT_MERGE_MAX_ENTRIES
+        ):
+            # With many types, a single sort of all entries is faster than a
+            # heap merge: Timsort finds the sorted runs of the entry lists.
+            # The sort is stable, so entries with the same ``begin`` and
+            # ``end`` keep the order of the type names in ``type_names``.
+            all_entries = list(chain.from_iterable(entry_lists))
+            all_entries.sort(key=_annotation_sort_key)
+            yield from all_entries
+        else:
+            # ``_merge_runs`` walks every entry list with its own iterator
+            # instead of indexing the sorted lists, and it is stable: entries
+            # with the same ``begin`` and ``end`` are yielded in the order of
+            # their entry lists, i.e., the order of the type names in
+            # ``type_names``.
+            yield from _merge_runs(entry_lists)
 
     def get(
         self, type_name: str, include_sub_type: bool = True
@@ -844,24 +1204,31 @@ class DataStore(BaseStore):
 
         Returns:
             An iterator of the entries matching the provided arguments.
+
+        Raises:
+            KeyError: when ``include_sub_type`` is False and there is no entry
+                of type ``type_name``.
         """
+        # The entries are chained by C-level iterators rather than yielded one
+        # by one from a Python generator.
         if include_sub_type:
-            entry_class = get_class(type_name)
-            all_types = []
-            # iterate all classes to find subclasses
-            for type in self.__elements:
-                if issubclass(get_class(type), entry_class):
-                    all_types.append(type)
-            for type in all_types:
-                for entry in self.__elements[type]:
-                    yield entry
+            all_types = self._subtype_cache.get(type_name)
+            if all_types is None:
+                entry_class = _get_class(type_name)
+                all_types = []
+                # iterate all classes to find subclasses
+                for type in self.__elements:
+                    if issubclass(_get_class(type), entry_class):
+                        all_types.append(type)
+                self._subtype_cache[type_name] = all_types
+            return chain.from_iterable(
+                [self.__elements[type] for type in all_types]
+            )
         else:
-            try:
-                entries = self.__elements[type_name]
-            except KeyError as e:
-                raise KeyError(f"type {type_name} does not exist") from e
-            for entry in entries:
-                yield entry
+            entries = self.__elements.get(type_name)
+            if entries is None:
+                raise KeyError(f"type {type_name} does not exist")
+            return iter(entries)
 
     def next_entry(self, tid: int) -> Optional[List]:
         r"""Get the next entry of the same type as the ``tid`` entry.
@@ -881,8 +1248,8 @@ class DataStore(BaseStore):
         Raises:
             IndexError: An error occurred accessing index out out of entry list.
         """
-        _, entry_type = self.get_entry(tid=tid)
-        index_id: int = self.get_entry_index(tid=tid)
+        entry, entry_type = self.get_entry(tid=tid)
+        index_id: int = self._get_entry_index(entry, entry_type)
         entry_list = self.__elements[entry_type]
         if not 0 <= index_id < len(entry_list):
             raise IndexError(
@@ -910,8 +1277,8 @@ class DataStore(BaseStore):
         Raises:
             IndexError: An error occurred accessing index out out of entry list.
         """
-        _, entry_type = self.get_entry(tid=tid)
-        index_id: int = self.get_entry_index(tid=tid)
+        entry, entry_type = self.get_entry(tid=tid)
+        index_id: int = self._get_entry_index(entry, entry_type)
         entry_list = self.__elements[entry_type]
         if not 0 <= index_id < len(entry_list):
             raise IndexError(
@@ -977,8 +1344,4 @@ class DataStore(BaseStore):
             # ["speaker", "part_id", "sentiment", "classification", "classifications"]
 
         """
-        class_ = get_class(input_entry_class_name)
-        try:
-            return list(class_.__dataclass_fields__.keys())
-        except AttributeError:
-            return []
+        return list(_get_entry_attributes(input_entry_class_name))
@@ -18,6 +18,7 @@ Unit tests for data store related operations.
 import logging
 import unittest
 import copy
+import numpy as np
 from sortedcontainers import SortedList
 from typing import Optional, Dict
 from dataclasses import dataclass
@@ -468,6 +469,50 @@ class DataStoreTest(unittest.TestCase):
         elements = list(self.data_store.co_iterator_annotation_like(type_names))
         self.assertEqual(elements, ordered_elements2)
 
+        # test iterate a single type
+        elements = list(self.data_store.co_iterator_annotation_like([sent_tn]))
+        self.assertEqual(
+            elements, [ordered_elements1[0], ordered_elements1[3]]
+        )
+
+        # test iterate more than two types
+        em_tn = "ft.onto.base_ontology.EntityMention"
+        em_tid = self.data_store.add_annotation_raw(em_tn, 0, 5)
+        elements = list(
+            self.data_store.co_iterator_annotation_like(
+                [doc_tn, em_tn, sent_tn]
+            )
+        )
+        self.assertEqual(
+            [entry[2] for entry in elements],
+            [1234, em_tid, 9999, 3456, 1234567],
+        )
+
+        # test runs of consecutive entries from the same type
+        sw_tn = "ft.onto.base_ontology.Subword"
+        sw_tids = self.data_store.add_annotations_raw(
+            sw_tn, [0, 3, 6, 56], [2, 5, 10, 60]
+        )
+        elements = list(
+            self.data_store.co_iterator_annotation_like(
+                [doc_tn, em_tn, sent_tn, sw_tn]
+            )
+        )
+        self.assertEqual(
+            [entry[2] for entry in elements],
+            [
+                sw_tids[0],
+                1234,
+                em_tid,
+                9999,
+                3456,
+                sw_tids[1],
+                sw_tids[2],
+                1234567,
+                sw_tids[3],
+            ],
+        )
+
         token_tn = "ft.onto.base_ontology.Token"
         # include Token to test non-exist list
         
@@ -484,6 +529,51 @@ class DataStoreTest(unittest.TestCase):
 
         self.assertRaises(ValueError, value_err_fn)
 
+    def test_co_iterator_annotation_like_many_types(self):
+        type_names = [
+            "ft.onto.base_ontology." + name
+            for name in [
+                "Body",
+                "ConstituentNode",
+                "Document",
+                "EntityMention",
+                "EventMention",
+                "MCOption",
+                "MCQuestion",
+                "MRCQuestion",
+                "PredicateArgument",
+                "PredicateMention",
+                "Sentence",
+                "Subword",
+                "Title",
+                "Token",
+                "Utterance",
+                "UtteranceContext",
+            ]
+        ]
+        for i, tn in enumerate(type_names):
+            if tn.endswith(("Document", "Sentence")):
+                continue
+            # every type shares the span (0, 5) with the others
+            self.data_store.add_annotations_raw(
+                tn, [0, 3 * i, 50 - i], [5, 3 * i + 4, 60]
+            )
+
+        expected = sorted(
+            (
+                entry
+                for tn in type_names
+                for entry in self.data_store._DataStore__elements[tn]
+            ),
+            key=lambda entry: (
+                entry[0],
+                entry[1],
+                type_names.index(entry[3]),
+            ),
+        )
+        elements = list(self.data_store.co_iterator_annotation_like(type_names))
+        self.assertEqual(elements, expected)
+
     def test_add_annotation_raw(self):
         # test add Document entry
         self.data_store.add_annotation_raw("ft.onto.base_ontology.Document", 1, 5)
@@ -503,6 +593,108 @@ class DataStoreTest(unittest.TestCase):
         self.assertEqual(len(DataStore._type_attributes), 3)
         self.assertEqual(len(self.data_store._DataStore__entry_dict), 8)
 
+        # test add spans given as NumPy integers
+        token_tn = "ft.onto.base_ontology.Token"
+        subword_tn = "ft.onto.base_ontology.Subword"
+        title_tn = "ft.onto.base_ontology.Title"
+        tok_long = self.data_store.add_annotation_raw(
+            token_tn, np.int64(0), np.int64(100)
+        )
+        tok_short = self.data_store.add_annotation_raw(
+            token_tn, np.int64(5), np.int64(6)
+        )
+        tok_first = self.data_store.add_annotation_raw(
+            token_tn, np.int32(0), np.int32(3)
+        )
+        sw_long = self.data_store.add_annotation_raw(
+            subword_tn, np.int64(0), np.int64(100)
+        )
+        sw_short = self.data_store.add_annotation_raw(
+            subword_tn, np.int64(2), np.int64(4)
+        )
+        title = self.data_store.add_annotation_raw(
+            title_tn, np.int64(1), np.int64(2)
+        )
+        self.assertEqual(
+            [entry[:3] for entry in self.data_store.get(token_tn)],
+            [[0, 3, tok_first], [0, 100, tok_long], [5, 6, tok_short]],
+        )
+        self.assertIs(type(self.data_store.get_entry(tok_long)[0][0]), int)
+        elements = self.data_store.co_iterator_annotation_like(
+            [token_tn, subword_tn]
+        )
+        self.assertEqual(
+            [entry[2] for entry in elements],
+            [tok_first, tok_long, sw_long, sw_short, tok_short],
+        )
+        elements = self.data_store.co_iterator_annotation_like(
+            [subword_tn, token_tn, title_tn]
+        )
+        self.assertEqual(
+            [entry[2] for entry in elements],
+            [tok_first, sw_long, tok_long, title, sw_short, tok_short],
+        )
+
+        # test add spans with out-of-range end indices
+        with self.assertRaises(ValueError):
+            self.data_store.add_annotation_raw(token_tn, 5, -1)
+        with self.assertRaises(ValueError):
+            self.data_store.add_annotation_raw(token_tn, 4, np.int64(-1))
+        with self.assertRaises(ValueError):
+            self.data_store.add_annotation_raw(token_tn, 0, 2**64)
+        with self.assertRaises(ValueError):
+            self.data_store.add_annotations_raw(token_tn, [1, 5], [2, -1])
+
+        # test add spans that are not integers
+        with self.assertRaises(TypeError):
+            self.data_store.add_annotation_raw(token_tn, 1.7, 3.9)
+        with self.assertRaises(TypeError):
+            self.data_store.add_annotation_raw(token_tn, "2", "5")
+        with self.assertRaises(TypeError):
+            self.data_store.add_annotation_raw(token_tn, True, False)
+        with self.assertRaises(TypeError):
+            self.data_store.add_annotations_raw(
+                token_tn, np.array([1.0, 2.0]), np.array([3.0, 4.0])
+            )
+        self.assertEqual(
+            len(self.data_store._DataStore__elements[token_tn]), 3
+        )
+        self.assertEqual(len(self.data_store._DataStore__entry_dict), 14)
+
+    def test_add_annotations_raw(self):
+        # test add Sentence entries to an existing list
+        sent_tn = "ft.onto.base_ontology.Sentence"
+        tids = self.data_store.add_annotations_raw(
+            sent_tn, np.array([30, 1]), np.array([40, 4])
+        )
+        self.assertEqual(len(tids), 2)
+        self.assertEqual(
+            [entry[:3] for entry in self.data_store.get(sent_tn)],
+            [
+                [1, 4, tids[1]],
+                [6, 9, 9999],
+                [30, 40, tids[0]],
+                [55, 70, 1234567],
+            ],
+        )
+        self.assertIs(type(self.data_store.get_entry(tids[0])[0][0]), int)
+        self.assertEqual(len(self.data_store._DataStore__entry_dict), 7)
+
+        # test add entries of a new annotation type
+        em_tn = "ft.onto.base_ontology.EntityMention"
+        tids = self.data_store.add_annotations_raw(em_tn, [8, 2, 5], [9, 3, 7])
+        self.assertEqual(
+            [self.data_store.get_entry_index(tid) for tid in tids], [2, 0, 1]
+        )
+        self.assertEqual(len(self.data_store._DataStore__entry_dict), 10)
+
+        # test add an empty batch
+        self.assertEqual(self.data_store.add_annotations_raw(em_tn, [], []), [])
+
+        # test add spans with mismatched lengths
+        with self.assertRaises(ValueError):
+            self.data_store.add_annotations_raw(em_tn, [1, 2], [3])
+
     def test_get_attribute(self):
         speaker = self.data_store.get_attribute(9999, "speaker")
         classifications = self.data_store.get_attribute(3456, "classifications")
@@ -570,6 +762,26 @@ class DataStoreTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.data_store.get_entry_index(1111)
 
+        # Entries sharing the same span are distinguished by their tid
+        em_tn = "ft.onto.base_ontology.EntityMention"
+        tids = [
+            self.data_store.add_annotation_raw(em_tn, 10, 12)
+            for _ in range(3)
+        ]
+        indices = [self.data_store.get_entry_index(tid) for tid in tids]
+        self.assertEqual(sorted(indices), [0, 1, 2])
+        self.data_store.delete_entry(tids[1])
+        self.assertEqual(
+            len(self.data_store._DataStore__elements[em_tn]), 2
+        )
+        self.assertEqual(
+            sorted(
+                self.data_store.get_entry_index(tid)
+                for tid in (tids[0], tids[2])
+            ),
+            [0, 1],
+        )
+
     def test_get(self):
         # get document entries
         instances = list(self.data_store.get("ft.onto.base_ontology.Document"))
@@ -590,6 +802,40 @@ class DataStoreTest(unittest.TestCase):
         )
         self.assertEqual(len(instances), 0)
 
+        # get entries of a type that does not exist
+        with self.assertRaises(KeyError):
+            self.data_store.get(
+                "ft.onto.base_ontology.Token", include_sub_type=False
+            )
+
+        # get entries of types added or removed after a previous query
+        em_tid = self.data_store.add_annotation_raw(
+            "ft.onto.base_ontology.EntityMention", 1, 3
+        )
+        instances = list(self.data_store.get("forte.data.ontology.core.Entry"))
+        self.assertEqual(len(instances), 6)
+        instances = list(
+            self.data_store.get("forte.data.ontology.top.Annotation")
+        )
+        self.assertEqual(len(instances), 6)
+        self.data_store.delete_entry(em_tid)
+        instances = list(
+            self.data_store.get("forte.data.ontology.top.Annotation")
+        )
+        self.assertEqual(len(instances), 5)
+
+        # adding a type after a query does not resolve its class
+        span_tn = "no.such.Span"
+        DataStore._type_attributes[span_tn] = {
+            "attributes": {},
+            "parent_class": set(),
+        }
+        span_tid = self.data_store.add_annotation_raw(span_tn, 0, 1)
+        self.assertEqual(
+            [entry[2] for entry in self.data_store.get(span_tn, False)],
+            [span_tid],
+        )
+
     def test_delete_entry(self):
         # delete annotation
         # has a total of 5 entries